@@ -1,10 +1,11 @@
 import os
 import json
 import logging
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from psd_tools import PSDImage
-from PIL import Image, ImageChops
+from PIL import Image
 import cv2
 import numpy as np
 
@@ -37,7 +38,33 @@ def export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_p
     else:
         additional_path = None
 
+    # Try to find a file in the PSD directory, subfolder, or additional folder that matches layer_name
+    search_paths = [psd_dir]
+    if subfolder_path and os.path.exists(subfolder_path):
+        search_paths.append(subfolder_path)
+        logging.debug(f"Subfolder search path added: {subfolder_path}")
+    else:
+        logging.debug(f"Subfolder path does not exist or not specified: {subfolder_path}")
+
+    if additional_path and os.path.exists(additional_path):
+        search_paths.append(additional_path)
+        logging.debug(f"Additional search path added: {additional_path}")
+    else:
+        logging.debug(f"Additional search path does not exist or not specified: {additional_path}")
+
+    # Exact and lowercase filename lookups per search path , listed once instead of a stat for every layer and extension
+    search_path_files = {}
+    search_path_index = {}
+    for search_path in search_paths:
+        files = os.listdir(search_path)
+        lowercase_files = {}
+        for file in files:
+            lowercase_files.setdefault(file.lower(), file)
+        search_path_files[search_path] = set(files)
+        search_path_index[search_path] = lowercase_files
+
     layer_data = []
+    external_image_cache = {}  # Decoded external files by path , layers sharing a source are read once
 
     def process_layers(layers):
         for layer in layers:
@@ -71,22 +98,9 @@ def export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_p
                 logging.debug(f"Exporting layer image to: {layer_image_path}")
                 layer_image.save(layer_image_path)
 
-                # Try to find a file in the PSD directory, subfolder, or additional folder that matches layer_name
                 possible_extensions = ['.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp']
                 found = False
                 external_file_path = None
-                search_paths = [psd_dir]
-                if subfolder_path and os.path.exists(subfolder_path):
-                    search_paths.append(subfolder_path)
-                    logging.debug(f"Subfolder search path added: {subfolder_path}")
-                else:
-                    logging.debug(f"Subfolder path does not exist or not specified: {subfolder_path}")
-
-                if additional_path and os.path.exists(additional_path):
-                    search_paths.append(additional_path)
-                    logging.debug(f"Additional search path added: {additional_path}")
-                else:
-                    logging.debug(f"Additional search path does not exist or not specified: {additional_path}")
 
                 # Normalize layer name for matching
                 #normalized_layer_name = layer_name.strip().lower()
@@ -96,23 +110,19 @@ def export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_p
                     logging.debug(f"Searching in directory: {search_path}")
                     for ext in possible_extensions:
                         candidate_file = f"{layer_name}{ext}"
-                        candidate_path = os.path.normpath(os.path.join(search_path, candidate_file))
-                        logging.debug(f"Checking if file exists: {candidate_path}")
-                        if os.path.exists(candidate_path):
-                            external_file_path = candidate_path
+                        logging.debug(f"Checking if file exists: {candidate_file} in {search_path}")
+                        if candidate_file in search_path_files[search_path]:
+                            external_file_path = os.path.normpath(os.path.join(search_path, candidate_file))
                             found = True
                             logging.info(f"Found matching external file: {external_file_path}")
                             break
                         else:
                             # Case-insensitive matching
-                            for file in os.listdir(search_path):
-                                #print(str(file.lower()))
-                                if file.lower() == f"{normalized_layer_name}{ext}".lower():
-                                    external_file_path = os.path.normpath(os.path.join(search_path, file))
-                                    found = True
-                                    logging.info(f"Found matching external file (case-insensitive): {external_file_path}")
-                                    break
-                            if found:
+                            file = search_path_index[search_path].get(f"{normalized_layer_name}{ext}".lower())
+                            if file:
+                                external_file_path = os.path.normpath(os.path.join(search_path, file))
+                                found = True
+                                logging.info(f"Found matching external file (case-insensitive): {external_file_path}")
                                 break
                     if found:
                         break
@@ -123,20 +133,20 @@ def export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_p
                 exported_layer_path = layer_image_path
 
                 if external_file_path and use_image_matching:
-                    # Load images
-                    exported_img_cv = cv2.imread(exported_layer_path, cv2.IMREAD_UNCHANGED)
-                    external_img_cv = cv2.imread(external_file_path, cv2.IMREAD_UNCHANGED)
+                    # Load images , the exported layer is still in memory so it is not read back from disk
+                    exported_img_cv = np.asarray(layer_image.convert('RGB'))
+                    external_img_cv = external_image_cache.get(external_file_path)
+                    if external_img_cv is None:
+                        external_img_cv = cv2.imread(external_file_path, cv2.IMREAD_UNCHANGED)
+                        external_image_cache[external_file_path] = external_img_cv
 
-                    if exported_img_cv is None:
-                        logging.error(f"Failed to load exported layer image: {exported_layer_path}")
-                        continue
                     if external_img_cv is None:
                         logging.error(f"Failed to load external image: {external_file_path}")
                         external_file_path = None  # Reset external_file_path since loading failed
                     else:
                         # Convert images to grayscale for template matching
                         try:
-                            exported_gray = cv2.cvtColor(exported_img_cv, cv2.COLOR_BGRA2GRAY) if exported_img_cv.shape[2] == 4 else cv2.cvtColor(exported_img_cv, cv2.COLOR_BGR2GRAY)
+                            exported_gray = cv2.cvtColor(exported_img_cv, cv2.COLOR_RGB2GRAY)
                             external_gray = cv2.cvtColor(external_img_cv, cv2.COLOR_BGRA2GRAY) if external_img_cv.shape[2] == 4 else cv2.cvtColor(external_img_cv, cv2.COLOR_BGR2GRAY)
                         except Exception as e:
                             logging.error(f"Error converting images to grayscale: {e}")
@@ -200,7 +210,8 @@ def export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_p
     }
     logging.info(f"Saving composition data to JSON file: {json_output_path}")
     with open(json_output_path, 'w') as f:
-        json.dump(composition_data, f, indent=4)
+        # One write of the encoded text , json.dump with indent streams many small writes
+        f.write(json.dumps(composition_data, indent=4))
 
 def reconstruct_composition(json_input_path, output_image_path):
     # Function remains unchanged
@@ -212,13 +223,16 @@ def reconstruct_composition(json_input_path, output_image_path):
     canvas_height = composition_data['canvas_height']
     logging.info(f"Canvas size for reconstruction: width={canvas_width}, height={canvas_height}")
 
-    # Create a new image with black background
-    final_composite = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 255))
+    # Create a new image with black background , every layer is matted on black so the composite stays opaque RGB
+    final_composite = Image.new('RGB', (canvas_width, canvas_height), (0, 0, 0))
 
     if not composition_data['layers']:
         logging.error("No layers found in composition data. The final composite will be empty.")
         return
 
+    # Matted pixels per image path , layers that resolve to the same external file are decoded once
+    matted_cache = {}
+
     # Reconstruct the composition
     for layer_info in composition_data['layers']:
         layer_name = layer_info['name']
@@ -235,24 +249,24 @@ def reconstruct_composition(json_input_path, output_image_path):
             logging.warning(f"Using exported layer image for '{layer_name}' as external file is not found")
             image_path = exported_layer_path
 
-        # Load the image
-        try:
-            layer_image = Image.open(image_path).convert('RGBA')
-        except Exception as e:
-            logging.error(f"Failed to open image '{image_path}': {e}")
-            continue
-
-        # Matte transparency on black
-        if layer_image.mode == 'RGBA':
-            background = Image.new('RGBA', layer_image.size, (0, 0, 0, 255))
-            layer_image = Image.alpha_composite(background, layer_image)
-
-        # Create a blank image with the same size as the canvas
-        layer_canvas = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
-        layer_canvas.paste(layer_image, (composite_left, composite_top))
-
-        # Apply lighten blend mode
-        final_composite = ImageChops.lighter(final_composite, layer_canvas)
+        matted = matted_cache.get(image_path)
+        if matted is None:
+            # Load the image
+            try:
+                layer_image = Image.open(image_path).convert('RGBA')
+            except Exception as e:
+                logging.error(f"Failed to open image '{image_path}': {e}")
+                continue
+            # Matte transparency on black
+            layer_np = np.asarray(layer_image, dtype=np.uint16)
+            matted = (layer_np[..., :3] * layer_np[..., 3:4] + 127) // 255
+            matted_cache[image_path] = matted
+
+        # Apply lighten blend mode in one pass , only the region under the layer can change
+        layer_height, layer_width = matted.shape[:2]
+        layer_box = (composite_left, composite_top, composite_left + layer_width, composite_top + layer_height)
+        blended = np.maximum(np.asarray(final_composite.crop(layer_box)), matted).astype(np.uint8)
+        final_composite.paste(Image.fromarray(blended, 'RGB'), layer_box)
 
     # Save the final composite image
     logging.info(f"Saving final composite image to: {output_image_path}")
@@ -276,6 +290,30 @@ def browse_additional_path():
         additional_entry.delete(0, tk.END)
         additional_entry.insert(0, folder_path)
 
+def set_job_buttons_state(state):
+    # Only one job at a time , a second job would write the same layer PNGs , JSON and composite
+    for button in (psd_generate_button, psd_full_process_button, json_generate_button):
+        button.config(state=state)
+
+def run_in_background(task, success_message, failure_message):
+    # PSD compositing and layer export take a while , keep the window responsive and report back on the Tk thread
+    def finish(show, title, message):
+        set_job_buttons_state(tk.NORMAL)
+        show(title, message)
+
+    def worker():
+        try:
+            task()
+        except Exception as e:
+            error_message = f"{failure_message}: {e}"
+            logging.error(error_message)
+            root.after(0, lambda: finish(messagebox.showerror, "Error", error_message))
+            return
+        root.after(0, lambda: finish(messagebox.showinfo, "Success", success_message))
+
+    set_job_buttons_state(tk.DISABLED)
+    threading.Thread(target=worker, daemon=True).start()
+
 def generate_json():
     psd_file = psd_entry.get()
     if not psd_file:
@@ -295,12 +333,10 @@ def generate_json():
     if not os.path.exists(exported_layers_dir):
         os.makedirs(exported_layers_dir)
 
-    try:
-        export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_path, use_image_matching, subfolder_search_path, additional_search_path)
-        messagebox.showinfo("Success", f"JSON file generated: {json_output_path}")
-    except Exception as e:
-        logging.error(f"Failed to generate JSON: {e}")
-        messagebox.showerror("Error", f"Failed to generate JSON: {e}")
+    run_in_background(
+        lambda: export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_path, use_image_matching, subfolder_search_path, additional_search_path),
+        f"JSON file generated: {json_output_path}",
+        "Failed to generate JSON")
 
 def generate_image():
     json_file = json_entry.get()
@@ -312,12 +348,10 @@ def generate_image():
     json_prefix = os.path.splitext(json_filename)[0]
     output_image_path = os.path.join(os.path.dirname(json_file), f"{json_prefix}_final_composite.png")
 
-    try:
-        reconstruct_composition(json_file, output_image_path)
-        messagebox.showinfo("Success", f"Composite image generated: {output_image_path}")
-    except Exception as e:
-        logging.error(f"Failed to generate image: {e}")
-        messagebox.showerror("Error", f"Failed to generate image: {e}")
+    run_in_background(
+        lambda: reconstruct_composition(json_file, output_image_path),
+        f"Composite image generated: {output_image_path}",
+        "Failed to generate image")
 
 def generate_full_process():
     psd_file = psd_entry.get()
@@ -339,13 +373,14 @@ def generate_full_process():
     if not os.path.exists(exported_layers_dir):
         os.makedirs(exported_layers_dir)
 
-    try:
+    def full_process():
         export_layers_and_generate_json(psd_file, exported_layers_dir, json_output_path, use_image_matching, subfolder_search_path, additional_search_path)
         reconstruct_composition(json_output_path, output_image_path)
-        messagebox.showinfo("Success", f"Composite image generated: {output_image_path}")
-    except Exception as e:
-        logging.error(f"Failed to complete full process: {e}")
-        messagebox.showerror("Error", f"Failed to complete full process: {e}")
+
+    run_in_background(
+        full_process,
+        f"Composite image generated: {output_image_path}",
+        "Failed to complete full process")
 
 # Create the main window
 root = tk.Tk()
@@ -4,6 +4,7 @@
 # leaf = scrolls 1-4 and 5-8 stored vertically  , twig = 2 columns of leafs , branch = spell scroll level arranged as 8 columns
 import os
 import re
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from psd_tools import PSDImage
 
@@ -176,11 +177,19 @@ def create_leaves(group_images):
     return leaves
 
 
+@lru_cache(maxsize=None)
+def load_font(font_path, font_size):
+    """
+    Loads a TrueType font once , every circle number is drawn with the same face.
+    """
+    return ImageFont.truetype(font_path, font_size)
+
+
 def create_number_image(number, width):
     """
     Creates an image with the given number centered horizontally.
     """
-    font = ImageFont.truetype(FONT_PATH, FONT_SIZE)
+    font = load_font(FONT_PATH, FONT_SIZE)
     text = str(number)
     # Create a blank image
     img_height = FONT_SIZE + 10
@@ -9,6 +9,9 @@ from psd_tools import PSDImage
 
 IMAGE_OUTPUT = "ui_spell_00_comp_nospace_wide.png"
 
+# intermediate leaves, twigs and branches are reopened once then deleted , favor encode speed over file size
+TEMP_PNG_COMPRESS_LEVEL = 1
+
 # Padding parameters
 LEAF_PADDING = 1
 TWIG_PADDING = 1
@@ -42,22 +45,29 @@ for filename in os.listdir('.'):
                 img = psd.composite()  # Get the flattened image
                 img = img.convert('RGBA')  # Ensure the image is in RGBA mode
                 leaf_name = f'temp_leaf_{group:02d}_{match.group(2)}_{match.group(3)}.png'
-                img.save(leaf_name)
+                img.save(leaf_name, compress_level=TEMP_PNG_COMPRESS_LEVEL)
             except Exception as e:
                 print(f'Error processing {filename}: {e}')
 
+# List the saved leaves once and bucket them by group , rather than re-listing the folder for every twig
+leaf_pattern = re.compile(r'temp_leaf_(\d{2})_[^_]+_0x[\dA-F]+\.png')
+leaves_by_group = {}
+for filename in os.listdir('.'):
+    leaf_match = leaf_pattern.match(filename)
+    if leaf_match:
+        leaves_by_group.setdefault(int(leaf_match.group(1)), []).append(filename)
+
 # Assemble rows (twigs)
 for group in range(1, num_groups + 1):
     twig = Image.new('RGBA', (images_per_group * (image_width + LEAF_PADDING) - LEAF_PADDING, image_height))
-    leaf_pattern = re.compile(f'temp_leaf_{group:02d}_[^_]+_0x[\dA-F]+\.png')
-    leaf_files = sorted(filter(leaf_pattern.match, os.listdir('.')))
+    leaf_files = sorted(leaves_by_group.get(group, []))
     for i, leaf in enumerate(leaf_files):
         try:
             img = Image.open(leaf)
             twig.paste(img, (i * (image_width + LEAF_PADDING), 0))
         except Exception as e:
             print(f'Error processing {leaf}: {e}')
-    twig.save(f'temp_twig_{group:02d}.png')
+    twig.save(f'temp_twig_{group:02d}.png', compress_level=TEMP_PNG_COMPRESS_LEVEL)
 
 # Stack rows into columns (branches)
 for branch_num in range(1, num_groups // group_split + 1):
@@ -68,7 +78,7 @@ for branch_num in range(1, num_groups // group_split + 1):
             branch.paste(twig, (0, (group - 1) % group_split * (image_height + TWIG_PADDING)))
         except Exception as e:
             print(f'Error processing twig_{group:02d}.png: {e}')
-    branch.save(f'temp_branch_{branch_num}.png')
+    branch.save(f'temp_branch_{branch_num}.png', compress_level=TEMP_PNG_COMPRESS_LEVEL)
 
 # Arrange branches side by side (trees)
 tree = Image.new('RGBA', (2 * (images_per_group * (image_width + LEAF_PADDING) - LEAF_PADDING + BRANCH_PADDING) - BRANCH_PADDING, group_split * (image_height + TWIG_PADDING) - TWIG_PADDING))
@@ -88,8 +88,7 @@ def assemble_images(output_filename, img_order):
     for idx, filename in enumerate(img_order):
         try:
             img = Image.open(filename)
-            row = idx // NUM_COLUMNS
-            col = idx % NUM_COLUMNS
+            row, col = divmod(idx, NUM_COLUMNS)
             x_offset = col * (IMAGE_WIDTH + LEAF_PADDING)
             y_offset = row * (IMAGE_HEIGHT + TWIG_PADDING)
             tree.paste(img, (x_offset, y_offset), img)
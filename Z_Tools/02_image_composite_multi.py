@@ -18,6 +18,7 @@ class DraggableImage:
         self.app = app  # Reference to the main application
         self.canvas = canvas
         self.image = image
+        self.image_np = np.array(image)  # Pixel array reused by every scoring pass
         self.filename = filename
         self.image_tk = ImageTk.PhotoImage(self.image)
         self.id = self.canvas.create_image(x, y, image=self.image_tk, anchor='nw', tags='draggable')
@@ -36,6 +37,9 @@ class DraggableImage:
         # Select this image
         self.app.select_image(self)
         self.app.canvas.focus_set()  # Set focus to the canvas to receive key events
+        # Group membership cannot change mid drag , so tag the members once instead of on every motion event
+        if self.group:
+            self.app.tag_drag_group(self.group)
 
     def on_release(self, event):
         if self.app.use_edge_scoring.get():
@@ -47,7 +51,7 @@ class DraggableImage:
         dy = event.y - self.offset_y
         # Move group if image is part of one
         if self.group:
-            self.app.move_group(self.group, dx, dy)
+            self.canvas.move('drag_group', dx, dy)  # One canvas call for the whole group
         else:
             self.canvas.move(self.id, dx, dy)
         self.offset_x = event.x
@@ -73,8 +77,14 @@ class DraggableImage:
         edge_score_threshold = 80  # Adjusted threshold for better snapping
         snap_distance_threshold = 50  # Reduced proximity threshold for snapping
 
+        # Read each other image's rectangle once , candidate positions are then checked without querying the canvas
+        other_rects = {}
+        for img in other_images:
+            img_x, img_y = img.get_position()
+            other_rects[img] = (img_x, img_y, img_x + img.image.width, img_y + img.image.height)
+
         for other_img in other_images:
-            other_x, other_y = other_img.get_position()
+            other_x, other_y = other_rects[other_img][:2]
             other_width, other_height = other_img.image.width, other_img.image.height
 
             # Calculate distance between images
@@ -93,15 +103,16 @@ class DraggableImage:
                 # Snap current image to the top of other image
                 (other_x, other_y - current_height, 'bottom')
             ]
+            overlap_rects = [rect for img, rect in other_rects.items() if img is not other_img]
 
             for x, y, position in positions:
                 # Check for overlap with other images
-                if self.app.check_overlap(x, y, current_width, current_height, exclude=[self, other_img]):
+                if self.app.check_overlap(x, y, current_width, current_height, rects=overlap_rects):
                     continue  # Skip positions that cause overlap
 
                 # Calculate edge score
-                score = self.app.calculate_edge_score_single(self.image, x, y,
-                                                             other_img.image, other_x, other_y, position)
+                score = self.app.calculate_edge_score_single(self.image_np, x, y,
+                                                             other_img.image_np, other_x, other_y, position)
                 if score > best_score:
                     best_score = score
                     best_position = (x, y)
@@ -142,6 +153,9 @@ class ImageComposerApp:
         self.selected_image = None
         self.groups = {}  # Dictionary to hold images per group
         self.scores = {}  # Dictionary to hold scores per group
+        self.score_text_id = None  # Single canvas text item moved between selections
+        self.score_update_after_id = None  # Pending debounced rescore after arrow key nudges
+        self.last_scoring_state = None  # Selection , options and layout the score labels were computed for
 
         # Scoring options
         self.use_overlap_scoring = tk.BooleanVar(value=True)
@@ -227,6 +241,7 @@ class ImageComposerApp:
 
     def load_images(self):
         self.canvas.delete("all")
+        self.score_text_id = None
         self.draggable_images = []
         self.groups = {}  # Reset groups
         x, y = 50, 50
@@ -252,18 +267,22 @@ class ImageComposerApp:
                 best_image = None
                 best_ref_image = None
                 best_position_name = ''
+                # Placed images only move between rounds , read their positions once per round
+                placed_positions = [(ref_img, ref_img.get_position()) for ref_img in self.draggable_images]
+                placed_rects = [(ref_x, ref_y, ref_x + ref_img.image.width, ref_y + ref_img.image.height)
+                                for ref_img, (ref_x, ref_y) in placed_positions]
 
                 for img in unplaced_images:
-                    for ref_img in self.draggable_images:
+                    for ref_img, ref_position in placed_positions:
                         positions = ['left', 'right', 'top', 'bottom']
                         for position in positions:
-                            x_pos, y_pos = self.get_position_adjacent(ref_img, img, position)
+                            x_pos, y_pos = self.get_position_adjacent(ref_img, img, position, ref_position)
                             # Check for overlap
-                            if self.check_overlap(x_pos, y_pos, img.image.width, img.image.height, exclude=[img]):
+                            if self.check_overlap(x_pos, y_pos, img.image.width, img.image.height, rects=placed_rects):
                                 continue
                             # Calculate edge score
                             score = self.calculate_edge_score_single(
-                                img.image, x_pos, y_pos, ref_img.image, *ref_img.get_position(), position)
+                                img.image_np, x_pos, y_pos, ref_img.image_np, *ref_position, position)
                             if score > best_score:
                                 best_score = score
                                 best_position = (x_pos, y_pos)
@@ -276,7 +295,7 @@ class ImageComposerApp:
                     unplaced_images.remove(best_image)
                     self.canvas.moveto(best_image.id, best_position[0], best_position[1])
                     # Merge groups
-                    self.merge_groups(best_image, best_ref_image.group)
+                    self.merge_groups(best_image, best_ref_image.group, update_display=False)
                 else:
                     # No good match found, place randomly
                     img = unplaced_images.pop(0)
@@ -308,6 +327,7 @@ class ImageComposerApp:
 
         # Clear current canvas
         self.canvas.delete("all")
+        self.score_text_id = None
         self.draggable_images = []
         self.groups = {}
 
@@ -353,6 +373,7 @@ class ImageComposerApp:
         if not sorted_images:
             return
 
+        use_edge = self.use_edge_scoring.get()
         fixed_images = [sorted_images[0]]  # Keep the leftmost piece fixed
         for idx in range(1, len(sorted_images)):
             target_image = sorted_images[idx]
@@ -369,45 +390,49 @@ class ImageComposerApp:
             # The x-position is fixed: adjacent to the right edge of prev_image
             x_fixed = prev_x + prev_w
 
-            # Get current y-position of target image
-            y0 = target_image.get_position()[1]
+            # Get current position of target image
+            x0, y0 = target_image.get_position()
 
             # Generate y-offsets within range
             y_offsets = range(-max_offset, max_offset + 1)
+            other_rects = self.get_image_rects(exclude=[target_image])
 
             for dy in y_offsets:
                 y = y0 + dy
 
                 # Check for overlap with fixed images
-                if self.check_overlap(x_fixed, y, target_image.image.width, target_image.image.height, exclude=[target_image]):
+                if self.check_overlap(x_fixed, y, target_image.image.width, target_image.image.height, rects=other_rects):
                     continue  # Skip positions that cause overlap
 
-                score = 0
-                if self.use_edge_scoring.get():
-                    score += self.calculate_edge_score_pair(prev_image, prev_x, prev_y, target_image, x_fixed, y, 'right', 'left')
+                if not use_edge:
+                    # Every position scores the same , the first free one wins
+                    best_dx = x_fixed - x0
+                    best_dy = dy
+                    break
 
+                score = self.calculate_edge_score_pair(prev_image, prev_x, prev_y, target_image, x_fixed, y, 'right', 'left')
                 if score > best_score:
                     best_score = score
-                    best_dx = x_fixed - target_image.get_position()[0]
-                    best_dy = y - target_image.get_position()[1]
+                    best_dx = x_fixed - x0
+                    best_dy = dy
 
-            # Move image to best position
-            self.canvas.move(target_image.id, best_dx, best_dy)
+            # Move image to best position , skipping the canvas call when it is already there
+            if best_dx or best_dy:
+                self.canvas.move(target_image.id, best_dx, best_dy)
             fixed_images.append(target_image)
 
             # Merge groups
-            self.merge_groups(target_image, prev_image.group)
+            self.merge_groups(target_image, prev_image.group, update_display=False)
 
-            # Update group assignments if necessary
-            self.update_scores()
-            self.update_score_display()
-
-        # After refinement, update group scores
+        # After refinement, refresh groups and scores once
+        self.update_group_display()
+        self.update_scores()
+        self.update_score_display()
         self.update_group_scores()
 
     def calculate_edge_score_pair(self, img1, x1, y1, img2, x2, y2, edge1, edge2):
-        img1_np = np.array(img1.image)
-        img2_np = np.array(img2.image)
+        img1_np = img1.image_np
+        img2_np = img2.image_np
 
         # Extract edges
         img1_edge = self.extract_edge(img1_np, edge1)
@@ -483,8 +508,8 @@ class ImageComposerApp:
         score = np.sum(both_opaque & rgb_match)
         return score
 
-    def get_position_adjacent(self, ref_img, target_img, position):
-        ref_x, ref_y = ref_img.get_position()
+    def get_position_adjacent(self, ref_img, target_img, position, ref_position=None):
+        ref_x, ref_y = ref_position if ref_position is not None else ref_img.get_position()
         ref_w, ref_h = ref_img.image.width, ref_img.image.height
         tgt_w, tgt_h = target_img.image.width, target_img.image.height
 
@@ -507,36 +532,56 @@ class ImageComposerApp:
     def move_selected_left(self, event):
         if self.selected_image:
             self.canvas.move(self.selected_image.id, -1, 0)
-            self.update_scores()
             self.update_score_display()
+            self.schedule_score_update()
 
     def move_selected_right(self, event):
         if self.selected_image:
             self.canvas.move(self.selected_image.id, 1, 0)
-            self.update_scores()
             self.update_score_display()
+            self.schedule_score_update()
 
     def move_selected_up(self, event):
         if self.selected_image:
             self.canvas.move(self.selected_image.id, 0, -1)
-            self.update_scores()
             self.update_score_display()
+            self.schedule_score_update()
 
     def move_selected_down(self, event):
         if self.selected_image:
             self.canvas.move(self.selected_image.id, 0, 1)
-            self.update_scores()
             self.update_score_display()
+            self.schedule_score_update()
+
+    def schedule_score_update(self):
+        # Held arrow keys repeat quickly , rescore once the piece has stopped moving
+        if self.score_update_after_id is not None:
+            self.master.after_cancel(self.score_update_after_id)
+        self.score_update_after_id = self.master.after(120, self.apply_score_update)
+
+    def apply_score_update(self):
+        self.score_update_after_id = None
+        self.update_scores()
+        self.update_score_display()
 
     def update_score_display(self):
-        # Remove existing score texts
-        self.canvas.delete('score_text')
-        if self.selected_image:
-            x, y = self.selected_image.get_position()
-            score_text = f"Score: {self.selected_image.score}"
-            self.selected_image.text_id = self.canvas.create_text(
-                x + self.selected_image.image.width // 2, y - 10,
-                text=score_text, fill='white', tags='score_text')
+        # Move and update the existing score text instead of recreating it on every motion event
+        if not self.selected_image:
+            if self.score_text_id is not None:
+                self.canvas.itemconfig(self.score_text_id, state='hidden')
+            return
+        x, y = self.selected_image.get_position()
+        score_text = f"Score: {self.selected_image.score}"
+        text_x = x + self.selected_image.image.width // 2
+        text_y = y - 10
+        if self.score_text_id is None:
+            self.score_text_id = self.canvas.create_text(
+                text_x, text_y, text=score_text, fill='white', tags='score_text')
+        else:
+            self.canvas.coords(self.score_text_id, text_x, text_y)
+            self.canvas.itemconfig(self.score_text_id, text=score_text, state='normal')
+            self.canvas.tag_raise(self.score_text_id)
+        self.selected_image.text_id = self.score_text_id
 
     def fine_tune_position(self):
         if self.selected_image is None:
@@ -558,11 +603,10 @@ class ImageComposerApp:
         best_score = float('-inf')
         best_dx = 0
         best_dy = 0
-        img_idx = self.draggable_images.index(self.selected_image)
         target_image = self.selected_image.image
 
         # Create a composite image of all other images
-        other_images = [img for idx, img in enumerate(self.draggable_images) if idx != img_idx]
+        other_images = [img for img in self.draggable_images if img is not self.selected_image]
         if not other_images:
             messagebox.showinfo("Info", "No other images to compare with.")
             return
@@ -572,17 +616,18 @@ class ImageComposerApp:
 
         # Get current position
         x0, y0 = self.selected_image.get_position()
-        target_np = np.array(target_image)
+        target_np = self.selected_image.image_np
 
         # Generate offsets
         offsets = [(dx, dy) for dx in range(-max_offset, max_offset + 1) for dy in range(-max_offset, max_offset + 1)]
+        other_rects = self.get_image_rects(exclude=[self.selected_image])
 
         for dx, dy in offsets:
             x = x0 + dx
             y = y0 + dy
 
             # Check for overlap with other images
-            if self.check_overlap(x, y, target_image.width, target_image.height, exclude=[self.selected_image]):
+            if self.check_overlap(x, y, target_image.width, target_image.height, rects=other_rects):
                 continue  # Skip positions that cause overlap
 
             score = 0
@@ -595,19 +640,31 @@ class ImageComposerApp:
                 best_dx = dx
                 best_dy = dy
 
+        # Already at the best position , nothing moved so nothing to rescore
+        if best_dx == 0 and best_dy == 0:
+            return
+
         # Move image to best position
         self.canvas.move(self.selected_image.id, best_dx, best_dy)
         self.update_scores()
         self.update_score_display()
 
-    def check_overlap(self, x, y, width, height, exclude=[]):
-        # Check if the rectangle at (x, y, width, height) overlaps with any other images
-        rect1 = (x, y, x + width, y + height)
+    def get_image_rects(self, exclude=()):
+        # Bounding rectangles of the images , read from the canvas once so search loops can reuse them
+        rects = []
         for img in self.draggable_images:
             if img in exclude:
                 continue
             img_x, img_y = img.get_position()
-            img_rect = (img_x, img_y, img_x + img.image.width, img_y + img.image.height)
+            rects.append((img_x, img_y, img_x + img.image.width, img_y + img.image.height))
+        return rects
+
+    def check_overlap(self, x, y, width, height, exclude=(), rects=None):
+        # Check if the rectangle at (x, y, width, height) overlaps with any other images
+        rect1 = (x, y, x + width, y + height)
+        if rects is None:
+            rects = self.get_image_rects(exclude)
+        for img_rect in rects:
             if self.rectangles_overlap(rect1, img_rect):
                 return True
         return False
@@ -618,14 +675,16 @@ class ImageComposerApp:
         left2, top2, right2, bottom2 = rect2
         return not (right1 <= left2 or right2 <= left1 or bottom1 <= top2 or bottom2 <= top1)
 
-    def move_group(self, group_name, dx, dy):
-        # Move all images in the group
-        for img in self.draggable_images:
-            if img.group == group_name:
-                self.canvas.move(img.id, dx, dy)
-        self.update_score_display()
+    def get_group_members(self, group_name):
+        return [img for img in self.draggable_images if img.group == group_name]
 
-    def merge_groups(self, img, other_group_name):
+    def tag_drag_group(self, group_name):
+        # Mark the dragged group's items with a shared tag so they move together with a single canvas.move
+        self.canvas.dtag('drag_group', 'drag_group')
+        for img in self.get_group_members(group_name):
+            self.canvas.addtag_withtag('drag_group', img.id)
+
+    def merge_groups(self, img, other_group_name, update_display=True):
         # Merge the group of img with other_group_name
         old_group_name = img.group
         if old_group_name == other_group_name:
@@ -634,7 +693,9 @@ class ImageComposerApp:
         for i in self.draggable_images:
             if i.group == old_group_name:
                 i.group = other_group_name
-        self.update_group_display()
+        # Bulk arrangement passes refresh the display once when they finish
+        if update_display:
+            self.update_group_display()
 
     def calculate_edge_score(self, composite_np, target_np, x_offset, y_offset):
         composite_h, composite_w = composite_np.shape[:2]
@@ -719,10 +780,7 @@ class ImageComposerApp:
         else:
             return None
 
-    def calculate_edge_score_single(self, img1, x1, y1, img2, x2, y2, position):
-        img1_np = np.array(img1)
-        img2_np = np.array(img2)
-
+    def calculate_edge_score_single(self, img1_np, x1, y1, img2_np, x2, y2, position):
         # Extract edges
         img1_edge = self.extract_edge(img1_np, position)
         opposite_position = {'left': 'right', 'right': 'left', 'top': 'bottom', 'bottom': 'top'}[position]
@@ -770,13 +828,14 @@ class ImageComposerApp:
         else:
             return None
 
-    def create_composite(self, draggable_images):
+    def create_composite(self, draggable_images, image_positions=None):
         # Create a composite image from the given draggable images
+        # image_positions maps an image to its (x, y) when the caller already read them from the canvas
         positions = []
         x_coords = []
         y_coords = []
         for img in draggable_images:
-            x, y = img.get_position()
+            x, y = image_positions[img] if image_positions is not None else img.get_position()
             x_coords.extend([x, x + img.image.width])
             y_coords.extend([y, y + img.image.height])
             positions.append((img, x, y))
@@ -791,7 +850,7 @@ class ImageComposerApp:
 
         composite_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         for img, x, y in positions:
-            composite_img.paste(img.image, (x - min_x, y - min_y), img.image)
+            composite_img.alpha_composite(img.image, (x - min_x, y - min_y))
 
         return composite_img, positions
 
@@ -800,24 +859,33 @@ class ImageComposerApp:
         if self.selected_image is None:
             self.score_label.config(text="Selected Piece Score: N/A")
             self.group_score_label.config(text="Selected Group Score: N/A")
+            self.last_scoring_state = None
             return
 
         # Determine scoring methods
         use_overlap = self.use_overlap_scoring.get()
         use_edge = self.use_edge_scoring.get()
 
+        # Read every canvas position once , the composites below would otherwise query each one per pairing
+        image_positions = {img: img.get_position() for img in self.draggable_images}
+
+        # A click selects on press and rescores on release , skip the rebuild when nothing changed in between
+        scoring_state = (self.selected_image, use_overlap, use_edge,
+                         tuple((image_positions[img], img.group) for img in self.draggable_images))
+        if scoring_state == self.last_scoring_state:
+            return
+        self.last_scoring_state = scoring_state
+
         # Calculate score for selected image
-        img_idx = self.draggable_images.index(self.selected_image)
-        target_image = self.selected_image.image
-        other_images = [img for idx, img in enumerate(self.draggable_images) if idx != img_idx]
+        other_images = [img for img in self.draggable_images if img is not self.selected_image]
 
         if not other_images:
             self.selected_image.score = 0
         else:
-            composite_img, positions = self.create_composite(other_images)
+            composite_img, positions = self.create_composite(other_images, image_positions)
             composite_np = np.array(composite_img)
-            x0, y0 = self.selected_image.get_position()
-            target_np = np.array(target_image)
+            x0, y0 = image_positions[self.selected_image]
+            target_np = self.selected_image.image_np
             score = 0
             if use_overlap:
                 score += self.calculate_overlap_score(composite_np, target_np, x0 - positions[0][1], y0 - positions[0][2])
@@ -832,15 +900,13 @@ class ImageComposerApp:
             group_images = [img for img in self.draggable_images if img.group == self.selected_image.group]
             total_score = 0
             for img in group_images:
-                img_idx = self.draggable_images.index(img)
-                target_image = img.image
                 other_images = [i for i in group_images if i != img]
                 if not other_images:
                     continue
-                composite_img_inner, positions_inner = self.create_composite(other_images)
+                composite_img_inner, positions_inner = self.create_composite(other_images, image_positions)
                 composite_np_inner = np.array(composite_img_inner)
-                x0, y0 = img.get_position()
-                target_np = np.array(target_image)
+                x0, y0 = image_positions[img]
+                target_np = img.image_np
                 score = 0
                 if use_overlap:
                     score += self.calculate_overlap_score(composite_np_inner, target_np, x0 - positions_inner[0][1], y0 - positions_inner[0][2])
@@ -905,22 +971,30 @@ class ImageComposerApp:
 
     def update_group_scores(self):
         # Recalculate total scores for all groups
+        use_overlap = self.use_overlap_scoring.get()
+        use_edge = self.use_edge_scoring.get()
+        # Bucket the images by group in one pass rather than filtering the full list per group
+        images_by_group = {}
+        image_positions = {}
+        for img in self.draggable_images:
+            images_by_group.setdefault(img.group, []).append(img)
+            image_positions[img] = img.get_position()
         for group_name in self.groups:
-            group_images = [img for img in self.draggable_images if img.group == group_name]
+            group_images = images_by_group.get(group_name, [])
             total_score = 0
             for img in group_images:
                 # Calculate score for each image in the group
                 other_images = [i for i in group_images if i != img]
                 if not other_images:
                     continue
-                composite_img_inner, positions_inner = self.create_composite(other_images)
+                composite_img_inner, positions_inner = self.create_composite(other_images, image_positions)
                 composite_np_inner = np.array(composite_img_inner)
-                x0, y0 = img.get_position()
-                target_np = np.array(img.image)
+                x0, y0 = image_positions[img]
+                target_np = img.image_np
                 score = 0
-                if self.use_overlap_scoring.get():
+                if use_overlap:
                     score += self.calculate_overlap_score(composite_np_inner, target_np, x0 - positions_inner[0][1], y0 - positions_inner[0][2])
-                if self.use_edge_scoring.get():
+                if use_edge:
                     score += self.calculate_edge_score(composite_np_inner, target_np, x0 - positions_inner[0][1], y0 - positions_inner[0][2])
                 total_score += score
             self.scores[group_name] = total_score
@@ -928,18 +1002,16 @@ class ImageComposerApp:
     def update_group_display(self):
         # Update the group display text
         self.group_display.delete('1.0', tk.END)
-        group_info = "Groups:\n"
         self.groups = {}
         for img in self.draggable_images:
             group = img.group if img.group else "Ungrouped"
-            if group not in self.groups:
-                self.groups[group] = []
-            self.groups[group].append(img.filename)
+            self.groups.setdefault(group, []).append(img.filename)
+        # Collect the lines and join once rather than growing one string per filename
+        lines = ["Groups:"]
         for group, filenames in self.groups.items():
-            group_info += f"{group}:\n"
-            for fname in filenames:
-                group_info += f"  {fname}\n"
-        self.group_display.insert(tk.END, group_info)
+            lines.append(f"{group}:")
+            lines.extend(f"  {fname}" for fname in filenames)
+        self.group_display.insert(tk.END, "\n".join(lines) + "\n")
 
     def prompt_group_name(self):
         # Prompt the user to enter a group name
@@ -953,17 +1025,19 @@ class ImageComposerApp:
         save_dir = filedialog.askdirectory(title="Select Directory to Save Composites and JSONs")
         if not save_dir:
             return
+        images_by_group = {}
+        for img in self.draggable_images:
+            images_by_group.setdefault(img.group, []).append(img)
         for group_name, image_filenames in self.groups.items():
-            group_images = [img for img in self.draggable_images if img.group == group_name]
+            group_images = images_by_group.get(group_name)
             if not group_images:
                 continue
             composite_img, positions = self.create_composite(group_images)
-            # Adjust positions relative to composite bounds
-            min_x = min([img.get_position()[0] for img in group_images])
-            min_y = min([img.get_position()[1] for img in group_images])
+            # Adjust positions relative to composite bounds , reusing the positions read by create_composite
+            min_x = min(x for _, x, _ in positions)
+            min_y = min(y for _, _, y in positions)
             image_positions = []
-            for img in group_images:
-                x, y = img.get_position()
+            for img, x, y in positions:
                 image_positions.append({
                     'filename': img.filename,
                     'x': x - min_x,
@@ -980,7 +1054,8 @@ class ImageComposerApp:
                 'composite_size': composite_img.size
             }
             with open(json_filename, 'w') as f:
-                json.dump(data, f, indent=4)
+                # One write of the encoded text , json.dump with indent streams many small writes
+                f.write(json.dumps(data, indent=4))
             print(f"Composite image saved to {composite_filename}")
             print(f"JSON data saved to {json_filename}")
         # Removed messagebox at the end
@@ -1013,8 +1088,11 @@ class ImageComposerApp:
         if not output_dir:
             return
         print("Starting disassembly of composite image...")
-        composition_size = data.get('composite_size', (5, 5))
-        scaled_image = composite_image.resize(composition_size, Image.Resampling.BICUBIC)
+        composition_size = tuple(data.get('composite_size', (5, 5)))
+        if composite_image.size == composition_size:
+            scaled_image = composite_image  # Unmodified size , crop directly without a full copy
+        else:
+            scaled_image = composite_image.resize(composition_size, Image.Resampling.BICUBIC)
 
         for img_info in data['images']:
             x = img_info['x']
@@ -188,9 +188,11 @@ def process_files(psd_folder, images_folder, action_set, action_name):
     logger.info(f"Found {len(psd_files)} PSD file(s) in '{psd_folder}'.")
     logger.debug(f"PSD Files: {psd_files}")
     
-    # Create a set of normalized PSD filenames (without extension) for quick lookup
-    normalized_psd_set = set(normalize_filename(Path(psd).stem) for psd in psd_files)
-    logger.debug(f"Normalized PSD filenames: {normalized_psd_set}")
+    # Map normalized PSD filenames (without extension) to the first matching PSD for quick lookup
+    normalized_psd_map = {}
+    for psd in psd_files:
+        normalized_psd_map.setdefault(normalize_filename(Path(psd).stem), psd)
+    logger.debug(f"Normalized PSD filenames: {set(normalized_psd_map)}")
     
     # Log all found images
     logger.info("Listing all external images found:")
@@ -206,13 +208,7 @@ def process_files(psd_folder, images_folder, action_set, action_name):
         logger.debug(f"Processing Image: '{img}' (Normalized: '{normalized_img_stem}')")
         
         # Find matching PSD
-        matching_psd = None
-        for psd in psd_files:
-            psd_stem = Path(psd).stem
-            normalized_psd_stem = normalize_filename(psd_stem)
-            if normalized_img_stem == normalized_psd_stem:
-                matching_psd = psd
-                break
+        matching_psd = normalized_psd_map.get(normalized_img_stem)
         
         if matching_psd:
             logger.info(f"Image '{img}' matches PSD '{matching_psd}'")
@@ -1,6 +1,10 @@
 import os
 import re
 
+# Compiled once , every filename in the walk is matched against these
+REGEX_HEX_SUFFIX = re.compile(r"(.*)(_?0x([0-9A-Fa-f]{1,4}))$")
+REGEX_FIRST_NUMBER = re.compile(r'\d+')
+
 def debug_print(*args):
     """Utility function to print debug messages."""
     print("[DEBUG]", *args)
@@ -13,7 +17,7 @@ def find_hex_suffix(name):
     - Returns None if no valid hex suffix is found.
     """
     # Match hexadecimal suffixes with 1 to 4 hex digits, with or without an underscore
-    match = re.search(r"(.*)(_?0x([0-9A-Fa-f]{1,4}))$", name)
+    match = REGEX_HEX_SUFFIX.search(name)
     if match:
         base_name = match.group(1)
         hex_suffix = match.group(3).upper()  # Only get the hex digits part
@@ -65,7 +69,7 @@ def process_filename(filename):
             return None
 
     # If no hex suffix, look for the first number in the name and convert it to hex
-    number_match = re.search(r'\d+', name)
+    number_match = REGEX_FIRST_NUMBER.search(name)
     if number_match:
         number = int(number_match.group(0))
         padded_hex = pad_hex_suffix(f"{number:X}")
@@ -5,6 +5,8 @@ import re
 import tkinter as tk
 from tkinter import filedialog
 
+REGEX_FIRST_NUMBER = re.compile(r'\d+')
+
 def number_to_hex(number_str):
     """Convert a number in string format to its hexadecimal representation."""
     return f"0x{int(number_str):X}"
@@ -16,7 +18,7 @@ def rename_files_in_folder_to_hex(folder_path):
 
     for filename in files:
         # Extract the first number found in the filename
-        match = re.search(r'\d+', filename)
+        match = REGEX_FIRST_NUMBER.search(filename)
         if match:
             number_str = match.group()
             hex_number = number_to_hex(number_str) 
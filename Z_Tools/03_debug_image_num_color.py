@@ -7,9 +7,9 @@ import re
 import numpy as np
 import random
 import glob
+from concurrent.futures import ThreadPoolExecutor
 # Image libraries
 from PIL import Image, ImageDraw, ImageFont , ImageEnhance
-import colorsys
 #UI
 import tkinter as tk
 from tkinter import filedialog
@@ -106,8 +106,11 @@ class ImageProcessor:
 
     def process_directory(self, target_directory, include_border):
         files = glob.glob(os.path.join(target_directory, "*.bmp"))
-        for infile in tqdm(files, desc="Processing Images"):
-            self.process_file(infile, include_border)
+        # Each file is independent , Pillow and NumPy release the GIL for the per pixel work
+        with ThreadPoolExecutor() as executor:
+            results = executor.map(lambda infile: self.process_file(infile, include_border), files)
+            for _ in tqdm(results, total=len(files), desc="Processing Images"):
+                pass
 
     def process_file(self, filepath, include_border):
         image = Image.open(filepath)
@@ -128,15 +131,14 @@ class ImageProcessor:
             text_width = bbox[2] - bbox[0] + self.padding
             text_height = bbox[3] - bbox[1] + self.padding
 
+            # Rasterize the outline and text once, then stamp them across the image
+            outline_mask, text_mask, stamp_x, stamp_y = self.render_label_masks(draw, text, font)
+            stamp_w, stamp_h = text_mask.size
             for y in range(0, image.height, text_height):
                 for x in range(0, image.width, text_width):
-                    # Draw text outline
-                    draw.text((x-1, y), text, font=font, fill="black")
-                    draw.text((x+1, y), text, font=font, fill="black")
-                    draw.text((x, y-1), text, font=font, fill="black")
-                    draw.text((x, y+1), text, font=font, fill="black")
-                    # Draw main text
-                    draw.text((x, y), text, font=font, fill="white")
+                    box = (x + stamp_x, y + stamp_y, x + stamp_x + stamp_w, y + stamp_y + stamp_h)
+                    image.paste("black", box, outline_mask)
+                    image.paste("white", box, text_mask)
 
         if include_border:
             border_width = 5
@@ -145,21 +147,58 @@ class ImageProcessor:
         image.save(filepath)
         print(f"Image {filepath} processed and saved.")
 
+    def render_label_masks(self, draw, text, font):
+        """ Render the 1px outline and the text as coverage masks , with the offset to place them at a draw position. """
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font, stroke_width=1)
+        outline_mask = Image.new('L', (right - left, bottom - top), 0)
+        ImageDraw.Draw(outline_mask).text((-left, -top), text, font=font, fill=255, stroke_width=1, stroke_fill=255)
+        text_mask = Image.new('L', outline_mask.size, 0)
+        ImageDraw.Draw(text_mask).text((-left, -top), text, font=font, fill=255)
+        return outline_mask, text_mask, left, top
+
     def colorize(self, image, hue):
         """ Apply a color shift to an image. """
         img = image.convert('RGBA')
         arr = np.array(img)
-        new_img = Image.fromarray(self.shift_hue(arr, hue).astype('uint8'), 'RGBA')
+        new_img = Image.fromarray(self.shift_hue(arr, hue), 'RGBA')
         return new_img
 
     def shift_hue(self, arr, hue):
         """ Shift the hue of an image. """
+        # vectorized form of colorsys.rgb_to_hsv / hsv_to_rgb over the whole array
         r, g, b, a = np.rollaxis(arr, axis=-1)
-        hsv = np.vectorize(lambda r, g, b: colorsys.rgb_to_hsv(r/255., g/255., b/255.))
-        h, s, v = hsv(r, g, b)
-        rgb = np.vectorize(lambda h, s, v: colorsys.hsv_to_rgb((h + hue/360.0) % 1.0, s, v))
-        r, g, b = rgb(h, s, v)
-        return np.dstack((r*255, g*255, b*255, a))
+        rgb = np.stack((r, g, b)).astype(np.float64) / 255.
+        r, g, b = rgb
+        maxc = rgb.max(axis=0)
+        minc = rgb.min(axis=0)
+        delta = maxc - minc
+        chroma = delta > 0
+        safe_delta = np.where(chroma, delta, 1.0)
+        s = np.where(chroma, delta / np.where(chroma, maxc, 1.0), 0.0)
+        rc = (maxc - r) / safe_delta
+        gc = (maxc - g) / safe_delta
+        bc = (maxc - b) / safe_delta
+        h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+        h = np.where(chroma, (h / 6.0) % 1.0, 0.0)
+        v = maxc
+
+        h = (h + hue/360.0) % 1.0
+        i = (h * 6.0).astype(np.int64)
+        f = (h * 6.0) - i
+        p = v * (1.0 - s)
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+        i = i % 6
+        r = np.choose(i, [v, q, p, p, t, v])
+        g = np.choose(i, [t, v, v, q, p, p])
+        b = np.choose(i, [p, p, t, v, v, q])
+        # write the channels straight into the uint8 result , assignment truncates like astype
+        out = np.empty(arr.shape, dtype=np.uint8)
+        out[..., 0] = r*255
+        out[..., 1] = g*255
+        out[..., 2] = b*255
+        out[..., 3] = a
+        return out
 
 def main():
     root = tk.Tk()
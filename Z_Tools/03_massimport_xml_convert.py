@@ -26,7 +26,7 @@ def process_line(line, prefix, category, line_number):
 
     Parameters:
         line (str): The line to process.
-        prefix (str): The prefix to add to the file paths.
+        prefix (str): The prefix to add to the file paths, ending with a path separator.
         category (str): The category for the XML tags.
         line_number (int): The current line number in the input file.
 
@@ -51,10 +51,6 @@ def process_line(line, prefix, category, line_number):
         print(f"Warning: Invalid item ID on line {line_number}: '{item_id_str}'", file=sys.stderr)
         return None  # Skip invalid item IDs
 
-    # Ensure the prefix ends with a backslash or slash
-    if not prefix.endswith(('/', '\\')):
-        prefix += '\\'
-
     # Build the new file path by adding the prefix
     new_file_path = prefix + file_path
 
@@ -71,6 +67,10 @@ def convert_data(input_file, output_file, prefix, category):
         prefix (str): Prefix to add to the file paths.
         category (str): Category for the XML tags.
     """
+    # Ensure the prefix ends with a backslash or slash , once rather than for every line
+    if not prefix.endswith(('/', '\\')):
+        prefix += '\\'
+
     try:
         with open(input_file, 'r') as infile, open(output_file, 'w') as outfile:
             outfile.write("<MassImport>")